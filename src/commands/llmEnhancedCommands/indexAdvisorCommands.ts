@@ -601,31 +601,27 @@ async function prepareOptimizationRequest(
 
     let indexesInfo: IndexItemModel[] | undefined;
     try {
-        if (!collectionStats) {
+        const { databaseName, collectionName } = queryContext;
+
+        // Collection stats, index definitions and index usage are independent reads.
+        // Issue them concurrently so this step costs the slowest round-trip rather
+        // than the sum of all three.
+        const fetchCollectionStats = async (): Promise<CollectionStats> => {
             const statsStart = Date.now();
-            collectionStats = await client.getCollectionStats(queryContext.databaseName, queryContext.collectionName);
+            const stats = await client.getCollectionStats(databaseName, collectionName);
             const statsDuration = Date.now() - statsStart;
             context.telemetry.measurements.collectionStatsDurationMs = statsDuration;
-            context.telemetry.properties.fetchedCollectionStats = 'true';
             ext.outputChannel.trace(
                 l10n.t('[Query Insights AI] getCollectionStats completed in {ms}ms', {
                     ms: statsDuration.toString(),
                 }),
             );
+            return stats;
+        };
 
-            // Check if cancelled after getCollectionStats
-            if (queryContext.signal?.aborted) {
-                ext.outputChannel.trace(l10n.t('[Query Insights AI] Cancelled after getCollectionStats'));
-                throw new UserCancelledError('AbortSignal');
-            }
-        } else {
-            context.telemetry.properties.fetchedCollectionStats = 'false';
-            ext.outputChannel.trace(l10n.t('[Query Insights AI] Using preloaded collection stats'));
-        }
-
-        if (!indexes) {
+        const fetchIndexesInfo = async (): Promise<IndexItemModel[]> => {
             const indexesInfoStart = Date.now();
-            indexesInfo = await client.listIndexes(queryContext.databaseName, queryContext.collectionName);
+            const info = await client.listIndexes(databaseName, collectionName);
             const indexesInfoDuration = Date.now() - indexesInfoStart;
             context.telemetry.measurements.listIndexesDurationMs = indexesInfoDuration;
             ext.outputChannel.trace(
@@ -633,15 +629,12 @@ async function prepareOptimizationRequest(
                     ms: indexesInfoDuration.toString(),
                 }),
             );
+            return info;
+        };
 
-            // Check if cancelled after listIndexes
-            if (queryContext.signal?.aborted) {
-                ext.outputChannel.trace(l10n.t('[Query Insights AI] Cancelled after listIndexes'));
-                throw new UserCancelledError('AbortSignal');
-            }
-
+        const fetchIndexesStats = async (): Promise<IndexStats[]> => {
             const indexesStatsStart = Date.now();
-            const indexesStats = await client.getIndexStats(queryContext.databaseName, queryContext.collectionName);
+            const stats = await client.getIndexStats(databaseName, collectionName);
             const indexesStatsDuration = Date.now() - indexesStatsStart;
             context.telemetry.measurements.indexStatsDurationMs = indexesStatsDuration;
             ext.outputChannel.trace(
@@ -649,11 +642,47 @@ async function prepareOptimizationRequest(
                     ms: indexesStatsDuration.toString(),
                 }),
             );
+            return stats;
+        };
+
+        if (collectionStats) {
+            context.telemetry.properties.fetchedCollectionStats = 'false';
+            ext.outputChannel.trace(l10n.t('[Query Insights AI] Using preloaded collection stats'));
+        }
+        if (indexes) {
+            context.telemetry.properties.fetchedIndexStats = 'false';
+            ext.outputChannel.trace(l10n.t('[Query Insights AI] Using preloaded index stats'));
+        }
 
+        // allSettled (not all) so every fetch has finished before we leave this block,
+        // and whatever succeeded is kept when another fetch fails.
+        const [statsResult, indexesInfoResult, indexesStatsResult] = await Promise.allSettled([
+            collectionStats ? Promise.resolve(collectionStats) : fetchCollectionStats(),
+            indexes ? Promise.resolve(undefined) : fetchIndexesInfo(),
+            indexes ? Promise.resolve(undefined) : fetchIndexesStats(),
+        ]);
+
+        // Check if cancelled while the stats were being fetched
+        if (queryContext.signal?.aborted) {
+            ext.outputChannel.trace(l10n.t('[Query Insights AI] Cancelled after fetching stats'));
+            throw new UserCancelledError('AbortSignal');
+        }
+
+        if (statsResult.status === 'fulfilled' && !collectionStats) {
+            collectionStats = statsResult.value;
+            context.telemetry.properties.fetchedCollectionStats = 'true';
+        }
+
+        if (indexesInfoResult.status === 'fulfilled') {
+            indexesInfo = indexesInfoResult.value;
+        }
+
+        if (!indexes && indexesInfo && indexesStatsResult.status === 'fulfilled' && indexesStatsResult.value) {
             // // TODO: handle search indexes for Atlas
             // const searchIndexes = await client.listSearchIndexesForAtlas(queryContext.databaseName, queryContext.collectionName);
-            indexes = indexesStats.map((indexStat) => {
-                const indexInfo = indexesInfo?.find((idx) => idx.name === indexStat.name);
+            const indexInfoByName = new Map(indexesInfo.map((idx) => [idx.name, idx]));
+            indexes = indexesStatsResult.value.map((indexStat) => {
+                const indexInfo = indexInfoByName.get(indexStat.name);
                 return {
                     ...indexStat,
                     ...indexInfo,
@@ -661,9 +690,14 @@ async function prepareOptimizationRequest(
             });
             // indexes.push(...searchIndexes);
             context.telemetry.properties.fetchedIndexStats = 'true';
-        } else {
-            context.telemetry.properties.fetchedIndexStats = 'false';
-            ext.outputChannel.trace(l10n.t('[Query Insights AI] Using preloaded index stats'));
+        }
+
+        // Report the first failure to the non-critical handler below
+        const failed = [statsResult, indexesInfoResult, indexesStatsResult].find(
+            (result): result is PromiseRejectedResult => result.status === 'rejected',
+        );
+        if (failed) {
+            throw failed.reason;
         }
 
         // Track stats availability in telemetry
@@ -685,7 +719,7 @@ async function prepareOptimizationRequest(
         );
 
         // Use basic index info as fallback if we have it (from successful listIndexes call)
-        if (indexesInfo && indexesInfo.length > 0) {
+        if (!indexes && indexesInfo && indexesInfo.length > 0) {
             // We have index info but getIndexStats failed, convert to IndexStats format
             indexes = indexesInfo
                 .filter((idx) => idx.key !== undefined)
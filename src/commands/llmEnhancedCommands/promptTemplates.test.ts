@@ -267,22 +267,22 @@ describe('promptTemplates', () => {
     });
 
     describe('loadPromptBody', () => {
-        it('should return fallback reason when extension context is not available', () => {
+        it('should return fallback reason when extension context is not available', async () => {
             // In test environment, ext.context is undefined
-            const result = loadPromptBody('index-advisor-find.prompt.md');
+            const result = await loadPromptBody('index-advisor-find.prompt.md');
             expect(result).toEqual({ fallbackReason: 'no-context' });
         });
     });
 
     describe('buildIndexAdvisorPrompt', () => {
-        it('should return inline fallback when resource file cannot be loaded', () => {
+        it('should return inline fallback when resource file cannot be loaded', async () => {
             // ext.context is undefined in test environment, so resource loading fails
-            const result = buildIndexAdvisorPrompt('find', 'Test Role', ['msg1'], 'task', 'INLINE_FALLBACK');
+            const result = await buildIndexAdvisorPrompt('find', 'Test Role', ['msg1'], 'task', 'INLINE_FALLBACK');
             expect(result).toBe('INLINE_FALLBACK');
         });
 
-        it('should return inline fallback for unknown command type', () => {
-            const result = buildIndexAdvisorPrompt('unknown', 'Test Role', ['msg1'], 'task', 'INLINE_FALLBACK');
+        it('should return inline fallback for unknown command type', async () => {
+            const result = await buildIndexAdvisorPrompt('unknown', 'Test Role', ['msg1'], 'task', 'INLINE_FALLBACK');
             expect(result).toBe('INLINE_FALLBACK');
         });
     });
@@ -3,7 +3,7 @@
  *  Licensed under the MIT License. See License.txt in the project root for license information.
  *--------------------------------------------------------------------------------------------*/
 
-import * as fs from 'fs';
+import * as fs from 'fs/promises';
 import * as path from 'path';
 import { l10n } from 'vscode';
 import { ext } from '../../extensionVariables';
@@ -70,9 +70,9 @@ const promptBodyCache: Map<string, string> = new Map();
  * @param resourceFileName - The filename within `resources/prompts/`
  * @returns The file contents or undefined
  */
-export function loadPromptBody(
+export async function loadPromptBody(
     resourceFileName: string,
-): { body: string } | { fallbackReason: 'no-context' | 'read-error' } {
+): Promise<{ body: string } | { fallbackReason: 'no-context' | 'read-error' }> {
     const cached = promptBodyCache.get(resourceFileName);
     if (cached !== undefined) {
         return { body: cached };
@@ -84,7 +84,7 @@ export function loadPromptBody(
             return { fallbackReason: 'no-context' };
         }
         const filePath = path.join(extensionPath, 'resources', 'prompts', resourceFileName);
-        const content = fs.readFileSync(filePath, 'utf-8');
+        const content = await fs.readFile(filePath, 'utf-8');
         if (content && content.trim().length > 0) {
             promptBodyCache.set(resourceFileName, content);
             return { body: content };
@@ -107,20 +107,20 @@ export function loadPromptBody(
  * @param inlineFallback - The full inline template constant to use as fallback
  * @returns The composed prompt template
  */
-export function buildIndexAdvisorPrompt(
+export async function buildIndexAdvisorPrompt(
     commandType: string,
     role: string,
     messages: string[],
     task: string,
     inlineFallback: string,
-): string {
+): Promise<string> {
     const resourceFile = INDEX_ADVISOR_PROMPT_RESOURCE_FILES[commandType];
     if (!resourceFile) {
         lastPromptSource = 'inline-fallback';
         return inlineFallback;
     }
 
-    const result = loadPromptBody(resourceFile);
+    const result = await loadPromptBody(resourceFile);
     if ('fallbackReason' in result) {
         lastPromptSource = `inline-fallback-${result.fallbackReason}`;
         return inlineFallback;
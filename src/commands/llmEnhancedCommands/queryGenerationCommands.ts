@@ -11,6 +11,7 @@ import { ClustersClient } from '../../documentdb/ClustersClient';
 import { ext } from '../../extensionVariables';
 import { CopilotService } from '../../services/copilotService';
 import { PromptTemplateService } from '../../services/promptTemplateService';
+import { createConcurrencyLimiter } from '../../utils/concurrencyLimiter';
 import { generateSchemaDefinition, type SchemaDefinition } from '../../utils/schemaInference';
 import { getQueryTypeConfig, type FilledPromptResult } from './promptTemplates';
 
@@ -204,27 +205,46 @@ export async function generateQuery(
                 }),
             );
 
-            let collectionIndex = 0;
-            for (const collection of collections) {
-                collectionIndex++;
-                const sampleDocsStart = Date.now();
-                const sampleDocs = await client.getSampleDocuments(queryContext.databaseName, collection.name, 3);
-                const sampleDocsDuration = Date.now() - sampleDocsStart;
-                context.telemetry.measurements[`sampleDocs_${collectionIndex}_DurationMs`] = sampleDocsDuration;
-                ext.outputChannel.trace(
-                    l10n.t('[Query Generation] Schema sampling for {collection} completed in {ms}ms', {
-                        collection: collection.name,
-                        ms: sampleDocsDuration.toString(),
+            // Sample collections concurrently, but cap the in-flight $sample aggregations the same
+            // way CollectionItem caps background counts: an uncapped burst on a database with many
+            // collections opens many sockets, competes with foreground operations and invites
+            // throttling on RU accounts.
+            // Promise.all preserves input order, so the schemas stay in listCollections order.
+            // It also rejects on the first failed sample; queued samples are skipped from then on
+            // instead of still being sent to a server that has just failed (or throttled) us.
+            const limit = createConcurrencyLimiter({ concurrency: 5 });
+            let samplingFailed = false;
+            const collectionSchemas = await Promise.all(
+                collections.map((collection, index) =>
+                    limit(async (): Promise<SchemaDefinition> => {
+                        if (samplingFailed) {
+                            return { collectionName: collection.name, fields: {} };
+                        }
+
+                        const sampleDocsStart = Date.now();
+                        let sampleDocs: Document[];
+                        try {
+                            sampleDocs = await client.getSampleDocuments(queryContext.databaseName, collection.name, 3);
+                        } catch (error) {
+                            samplingFailed = true;
+                            throw error;
+                        }
+                        const sampleDocsDuration = Date.now() - sampleDocsStart;
+                        context.telemetry.measurements[`sampleDocs_${index + 1}_DurationMs`] = sampleDocsDuration;
+                        ext.outputChannel.trace(
+                            l10n.t('[Query Generation] Schema sampling for {collection} completed in {ms}ms', {
+                                collection: collection.name,
+                                ms: sampleDocsDuration.toString(),
+                            }),
+                        );
+
+                        return sampleDocs.length > 0
+                            ? generateSchemaDefinition(sampleDocs, collection.name)
+                            : { collectionName: collection.name, fields: {} };
                     }),
-                );
-
-                if (sampleDocs.length > 0) {
-                    const schema = generateSchemaDefinition(sampleDocs, collection.name);
-                    schemas.push(schema);
-                } else {
-                    schemas.push({ collectionName: collection.name, fields: {} });
-                }
-            }
+                ),
+            );
+            schemas.push(...collectionSchemas);
         } else {
             if (!queryContext.collectionName) {
                 throw new Error(l10n.t('Collection name is required for single-collection query generation'));
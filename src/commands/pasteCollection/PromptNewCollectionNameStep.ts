@@ -161,7 +161,10 @@ export class PromptNewCollectionNameStep extends AzureWizardPromptStep<PasteColl
 
         try {
             const client = await ClustersClient.getClient(context.targetConnectionId);
-            const collections = await client.listCollections(context.targetDatabaseName);
+            // This runs on every keystroke. generateDefaultCollectionName() has just
+            // refreshed the collection list before the input box opened, so reuse the
+            // client cache instead of issuing a listCollections round-trip per keystroke.
+            const collections = await client.listCollections(context.targetDatabaseName, true);
 
             const existingCollection = collections.find((c) => c.name === name);
             if (existingCollection) {
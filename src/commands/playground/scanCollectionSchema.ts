@@ -35,7 +35,7 @@ export async function scanCollectionSchema(
         );
 
         const client = await ClustersClient.getClient(clusterId);
-        const collection = client.getMongoClient().db(databaseName).collection(collectionName);
+        const collection = client.getCollection(databaseName, collectionName);
 
         // Clear existing schema data so a fresh scan replaces stale entries
         SchemaStore.getInstance().clearSchema(clusterId, databaseName, collectionName);
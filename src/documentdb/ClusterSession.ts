@@ -127,6 +127,7 @@ export class ClusterSession {
     private _executionStatsCache?: { result: Document; timestamp: number };
     private _aiRecommendationsCache?: { result: unknown; timestamp: number };
     private _stage2ResponseCache?: { response: QueryInsightsStage2Response; totalCollectionDocs?: number };
+    private _collectionDocCountCache?: { result: number; timestamp: number };
 
     /**
      * Last query execution time in milliseconds
@@ -211,6 +212,7 @@ export class ClusterSession {
         this._executionStatsCache = undefined;
         this._aiRecommendationsCache = undefined;
         this._stage2ResponseCache = undefined;
+        this._collectionDocCountCache = undefined;
     }
 
     /**
@@ -335,16 +337,15 @@ export class ClusterSession {
         const acknowledged = await this._client.deleteDocuments(databaseName, collectionName, documentIds);
 
         if (acknowledged) {
-            this._currentRawDocuments = this._currentRawDocuments.filter((doc) => {
-                return !documentIds.some((id) => {
-                    const parsedId = parseDocumentId(id);
-
-                    const docIdStr = EJSON.stringify(doc._id, { relaxed: false }, 0);
-                    const parsedIdStr = EJSON.stringify(parsedId as Document, { relaxed: false }, 0);
+            // Normalize the deleted ids to canonical EJSON once, so each cached document
+            // needs a single stringify and set lookup instead of re-parsing every id.
+            const deletedIdStrs = new Set(
+                documentIds.map((id) => EJSON.stringify(parseDocumentId(id) as Document, { relaxed: false }, 0)),
+            );
 
-                    return docIdStr === parsedIdStr;
-                });
-            });
+            this._currentRawDocuments = this._currentRawDocuments.filter(
+                (doc) => !deletedIdStrs.has(EJSON.stringify(doc._id, { relaxed: false }, 0)),
+            );
         }
 
         return acknowledged;
@@ -492,6 +493,33 @@ export class ClusterSession {
         return explainResult;
     }
 
+    /**
+     * Gets the estimated number of documents in the collection, for Query Insights
+     * selectivity and index-strategy advisories.
+     *
+     * Cached together with the explain results: repeated Stage 2 requests for the
+     * same query reuse the count, and it is re-fetched after the query changes or
+     * the user runs/refreshes it (both clear the query insights caches).
+     *
+     * @param databaseName - Database name
+     * @param collectionName - Collection name
+     * @returns Estimated document count
+     */
+    public async getEstimatedDocumentCount(databaseName: string, collectionName: string): Promise<number> {
+        if (this._collectionDocCountCache) {
+            return this._collectionDocCountCache.result;
+        }
+
+        const result = await this._client.estimateDocumentCount(databaseName, collectionName);
+
+        this._collectionDocCountCache = {
+            result,
+            timestamp: Date.now(),
+        };
+
+        return result;
+    }
+
     /**
      * Gets the last query execution time in milliseconds
      * This is tracked during runFindQueryWithCache execution
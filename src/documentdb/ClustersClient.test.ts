@@ -9,4 +9,94 @@ describe('ClustersClient', () => {
     it('should be defined', () => {
         expect(ClustersClient).toBeDefined();
     });
+
+    describe('stats caches', () => {
+        const STATS_TTL_MS = 10_000;
+
+        let now: number;
+        let client: ClustersClient;
+        let featureApis: {
+            getCollectionStats: jest.Mock;
+            getIndexStats: jest.Mock;
+            createIndex: jest.Mock;
+        };
+
+        beforeEach(() => {
+            now = 1_000_000;
+            jest.spyOn(Date, 'now').mockImplementation(() => now);
+
+            featureApis = {
+                getCollectionStats: jest.fn().mockResolvedValue({ ns: 'db.coll', count: 1 }),
+                getIndexStats: jest.fn().mockResolvedValue([{ name: '_id_', accesses: { ops: 0 } }]),
+                createIndex: jest.fn().mockResolvedValue({ ok: 1 }),
+            };
+            const mongoClient = {
+                db: jest.fn(() => ({
+                    collection: jest.fn(() => ({ drop: jest.fn().mockResolvedValue(true) })),
+                })),
+            };
+
+            // The constructor is private and getClient() connects; build a bare instance instead
+            const ClientCtor = ClustersClient as unknown as new (clusterId: string) => ClustersClient;
+            client = new ClientCtor('test-cluster');
+            Object.assign(client, { _llmEnhancedFeatureApis: featureApis, _mongoClient: mongoClient });
+        });
+
+        afterEach(() => {
+            jest.restoreAllMocks();
+        });
+
+        it('serves repeated calls inside the TTL from the cache', async () => {
+            await client.getCollectionStats('db', 'coll');
+            await client.getIndexStats('db', 'coll');
+            now += STATS_TTL_MS - 1;
+            await client.getCollectionStats('db', 'coll');
+            await client.getIndexStats('db', 'coll');
+
+            expect(featureApis.getCollectionStats).toHaveBeenCalledTimes(1);
+            expect(featureApis.getIndexStats).toHaveBeenCalledTimes(1);
+        });
+
+        it('refetches once the TTL has expired', async () => {
+            await client.getCollectionStats('db', 'coll');
+            await client.getIndexStats('db', 'coll');
+            now += STATS_TTL_MS;
+            await client.getCollectionStats('db', 'coll');
+            await client.getIndexStats('db', 'coll');
+
+            expect(featureApis.getCollectionStats).toHaveBeenCalledTimes(2);
+            expect(featureApis.getIndexStats).toHaveBeenCalledTimes(2);
+        });
+
+        it('keys entries by namespace', async () => {
+            await client.getCollectionStats('db', 'coll');
+            await client.getCollectionStats('db', 'other');
+
+            expect(featureApis.getCollectionStats).toHaveBeenCalledTimes(2);
+        });
+
+        it('drops both caches after createIndex', async () => {
+            await client.getCollectionStats('db', 'coll');
+            await client.getIndexStats('db', 'coll');
+            await client.createIndex('db', 'coll', { key: { a: 1 } });
+            await client.getCollectionStats('db', 'coll');
+            await client.getIndexStats('db', 'coll');
+
+            expect(featureApis.getCollectionStats).toHaveBeenCalledTimes(2);
+            expect(featureApis.getIndexStats).toHaveBeenCalledTimes(2);
+        });
+
+        it('drops only the dropped collection after dropCollection', async () => {
+            await client.getCollectionStats('db', 'coll');
+            await client.getIndexStats('db', 'coll');
+            await client.getCollectionStats('db', 'other');
+            await client.dropCollection('db', 'coll');
+            await client.getCollectionStats('db', 'coll');
+            await client.getIndexStats('db', 'coll');
+            await client.getCollectionStats('db', 'other');
+
+            expect(featureApis.getCollectionStats).toHaveBeenCalledTimes(3);
+            expect(featureApis.getIndexStats).toHaveBeenCalledTimes(2);
+        });
+    });
 });
@@ -57,6 +57,7 @@ import {
     type IndexStats,
 } from './LlmEnhancedFeatureApis';
 import { SchemaStore } from './SchemaStore';
+import { applyClientOptionDefaults } from './utils/clientOptionDefaults';
 import { getHostsFromConnectionString, hasAzureDomain } from './utils/connectionStringHelpers';
 import { fixupDocumentDbExplain } from './utils/fixupDocumentDbExplain';
 import { getClusterMetadata, type ClusterMetadata } from './utils/getClusterMetadata';
@@ -130,6 +131,16 @@ export interface IndexItemModel {
     [key: string]: unknown; // Allow additional index properties
 }
 
+/**
+ * How long getCollectionStats and getIndexStats results are reused before hitting
+ * the server again. Kept short: the stats only need to be fresh enough to describe
+ * the collection to the index advisor. The TTL is what bounds staleness; writes
+ * made through this client's own methods also drop the entry early, but writes
+ * issued on a raw handle from getCollection() (e.g. the copy/paste bulkWrite) or
+ * from outside the extension are only picked up once the entry expires.
+ */
+const STATS_CACHE_TTL_MS = 10_000;
+
 export function isBulkWriteError(error: unknown): error is MongoBulkWriteError {
     return error instanceof MongoBulkWriteError;
 }
@@ -170,6 +181,20 @@ export class ClustersClient {
     private _databasesCache: DatabaseItemModel[] | null = null;
     /** In-memory cache for listCollections results, keyed by database name. */
     private _collectionsCache = new Map<string, CollectionItemModel[]>();
+    /**
+     * Short-lived caches for getCollectionStats and getIndexStats results, keyed by
+     * namespace (`db.collection`). Entries expire after STATS_CACHE_TTL_MS and are
+     * dropped early by the write methods on this class (index changes, inserts, upserts,
+     * deletes, collection/database drops). See STATS_CACHE_TTL_MS for what is not covered.
+     */
+    private _collectionStatsCache = new Map<string, { result: CollectionStats; timestamp: number }>();
+    private _indexStatsCache = new Map<string, { result: IndexStats[]; timestamp: number }>();
+    /**
+     * Collection handles keyed by namespace (`db.collection`). The driver builds a new
+     * Db and Collection object (resolving options and read/write concerns) on every
+     * `db().collection()` call; handles are stateless, so one per namespace is enough.
+     */
+    private _collectionHandles = new Map<string, Collection<Document>>();
 
     /**
      * Correlation ID linking the `connect`, `connect.staticmetadata`, and `connect.getmetadata`
@@ -243,6 +268,8 @@ export class ClustersClient {
         // Configure auth and get connection options
         const { connectionString, options } = await authHandler.configureAuth();
 
+        applyClientOptionDefaults(connectionString, options);
+
         const hosts = getHostsFromConnectionString(connectionString);
         const userAgentString = hasAzureDomain(...hosts) ? appendExtensionUserAgent() : undefined;
         if (userAgentString) {
@@ -292,6 +319,7 @@ export class ClustersClient {
         // Create the client instance first so we hold a reference during connection.
         // This allows callers to abort via abortSignal by closing the underlying client.
         this._mongoClient = new MongoClient(connectionString, options);
+        this._collectionHandles.clear();
 
         if (abortSignal?.aborted) {
             ext.outputChannel.debug('Connection aborted before connecting (already aborted signal).');
@@ -332,7 +360,9 @@ export class ClustersClient {
             // guard in case abort fires between the assignment and this removal.
             abortSignal?.removeEventListener('abort', onAbort);
 
-            this._llmEnhancedFeatureApis = new llmEnhancedFeatureApis(this._mongoClient);
+            this._llmEnhancedFeatureApis = new llmEnhancedFeatureApis(this._mongoClient, (db, coll) =>
+                this.collectionHandle(db, coll),
+            );
             this._queryInsightsApis = new QueryInsightsApis(this._mongoClient);
         } catch (error) {
             if (abortSignal?.aborted) {
@@ -567,7 +597,7 @@ export class ClustersClient {
 
     getCollection(databaseName: string, collectionName: string): Collection<Document> {
         try {
-            return this._mongoClient.db(databaseName).collection(collectionName);
+            return this.collectionHandle(databaseName, collectionName);
         } catch (error) {
             throw new Error(
                 l10n.t(
@@ -580,6 +610,20 @@ export class ClustersClient {
         }
     }
 
+    /**
+     * Returns the cached handle for a collection, creating it on first use.
+     * Unlike {@link getCollection}, driver errors (e.g. invalid names) propagate unchanged.
+     */
+    private collectionHandle(databaseName: string, collectionName: string): Collection<Document> {
+        const key = `${databaseName}.${collectionName}`;
+        let handle = this._collectionHandles.get(key);
+        if (!handle) {
+            handle = this._mongoClient.db(databaseName).collection(collectionName);
+            this._collectionHandles.set(key, handle);
+        }
+        return handle;
+    }
+
     async listDatabases(useCached?: boolean): Promise<DatabaseItemModel[]> {
         if (useCached && this._databasesCache) {
             return this._databasesCache;
@@ -675,6 +719,20 @@ export class ClustersClient {
         }
     }
 
+    /**
+     * Checks whether a collection exists without listing the whole database.
+     * Filters server-side by name with `nameOnly: true`, so at most one small
+     * entry is returned regardless of how many collections the database has.
+     */
+    async collectionExists(databaseName: string, collectionName: string): Promise<boolean> {
+        const matches = await this._mongoClient
+            .db(databaseName)
+            .listCollections({ name: collectionName }, { nameOnly: true })
+            .toArray();
+
+        return matches.length > 0;
+    }
+
     /**
      * Returns cached collection names for the given database, if available.
      * Does NOT trigger a network request. Returns `undefined` if no cache exists.
@@ -692,7 +750,7 @@ export class ClustersClient {
     }
 
     async listIndexes(databaseName: string, collectionName: string): Promise<IndexItemModel[]> {
-        const collection = this._mongoClient.db(databaseName).collection(collectionName);
+        const collection = this.collectionHandle(databaseName, collectionName);
         const indexes = await collection.indexes();
 
         let i = 0;
@@ -709,7 +767,7 @@ export class ClustersClient {
 
     async listSearchIndexesForAtlas(databaseName: string, collectionName: string): Promise<IndexItemModel[]> {
         try {
-            const collection = this._mongoClient.db(databaseName).collection(collectionName);
+            const collection = this.collectionHandle(databaseName, collectionName);
             const searchIndexes = await collection.aggregate([{ $listSearchIndexes: {} }]).toArray();
             let i = 0; // backup for indexes with no names
             return searchIndexes.map((index: Document) => ({
@@ -791,7 +849,13 @@ export class ClustersClient {
             }
         }
 
-        const collection = this._mongoClient.db(databaseName).collection(collectionName);
+        // Paged reads carry the page size as their limit. Ask for the whole page in the
+        // first batch rather than the server default (101 documents) plus a getMore.
+        if (options.limit && options.limit > 0) {
+            options.batchSize = options.limit;
+        }
+
+        const collection = this.collectionHandle(databaseName, collectionName);
         const documents = await collection.find(filterObj, options).toArray();
 
         return documents;
@@ -820,7 +884,7 @@ export class ClustersClient {
             limit: limit,
         };
 
-        const collection = this._mongoClient.db(databaseName).collection(collectionName);
+        const collection = this.collectionHandle(databaseName, collectionName);
         const documents = await collection.find(findQueryObj, options).toArray();
 
         //TODO: add the FindCursor to the return type for paging
@@ -847,7 +911,7 @@ export class ClustersClient {
         }
         // NOTE: toFilterQueryObj throws QueryError on invalid input - see JSDoc above
         const findQueryObj: Filter<Document> = toFilterQueryObj(findQuery);
-        const collection = this._mongoClient.db(databaseName).collection(collectionName);
+        const collection = this.collectionHandle(databaseName, collectionName);
 
         const count = await collection.countDocuments(findQueryObj, {
             // Use a read preference of 'primary' to ensure we get the most up-to-date
@@ -858,7 +922,7 @@ export class ClustersClient {
     }
 
     async estimateDocumentCount(databaseName: string, collectionName: string): Promise<number> {
-        const collection = this._mongoClient.db(databaseName).collection(collectionName);
+        const collection = this.collectionHandle(databaseName, collectionName);
 
         try {
             return await collection.estimatedDocumentCount();
@@ -948,7 +1012,7 @@ export class ClustersClient {
             }
         }
 
-        const collection = this._mongoClient.db(databaseName).collection(collectionName);
+        const collection = this.collectionHandle(databaseName, collectionName);
 
         /**
          * Streaming
@@ -959,7 +1023,7 @@ export class ClustersClient {
         try {
             while (await cursor.hasNext()) {
                 if (abortSignal.aborted) {
-                    console.debug('streamDocumentsWithQuery: Aborted by an abort signal.');
+                    ext.outputChannel.trace(l10n.t('streamDocumentsWithQuery: Aborted by an abort signal.'));
                     return;
                 }
 
@@ -981,10 +1045,11 @@ export class ClustersClient {
         const parsedDocumentIds = documentIds.map((id) => parseDocumentId(id));
 
         // Connect and execute
-        const collection = this._mongoClient.db(databaseName).collection(collectionName);
+        const collection = this.collectionHandle(databaseName, collectionName);
         const deleteResult: DeleteResult = await collection.deleteMany({
             _id: { $in: parsedDocumentIds },
         } as Filter<Document>);
+        this.invalidateStatsCaches(databaseName, collectionName);
 
         return deleteResult.acknowledged;
     }
@@ -993,7 +1058,7 @@ export class ClustersClient {
         const parsedDocumentId = parseDocumentId(documentId);
 
         // connect and execute
-        const collection = this._mongoClient.db(databaseName).collection(collectionName);
+        const collection = this.collectionHandle(databaseName, collectionName);
 
         const documentContent = await collection.findOne({ _id: parsedDocumentId } as Filter<Document>);
 
@@ -1019,30 +1084,31 @@ export class ClustersClient {
         }
 
         // connect and execute
-        const collection = this._mongoClient.db(databaseName).collection(collectionName);
+        const collection = this.collectionHandle(databaseName, collectionName);
 
         delete document._id;
 
-        const replaceResult = await collection.replaceOne(
+        // Replace (or insert) and read back the stored document in a single findAndModify
+        // round-trip, instead of a replaceOne followed by a findOne.
+        const newDocument = await collection.findOneAndReplace(
             // eslint-disable-next-line @typescript-eslint/no-unsafe-assignment
             { _id: parsedId },
 
             document as WithoutId<Document>,
-            { upsert: true },
+            { upsert: true, returnDocument: 'after' },
         );
+        this.invalidateStatsCaches(databaseName, collectionName);
 
-        // eslint-disable-next-line @typescript-eslint/no-unsafe-assignment, @typescript-eslint/no-explicit-any
-        const newDocumentId = (replaceResult.upsertedId as any) ?? parsedId;
-
-        // eslint-disable-next-line
-        const newDocument = await collection.findOne({ _id: newDocumentId });
+        // The filter matches on _id, so an upserted document always receives parsedId
+        const newDocumentId: unknown = newDocument?._id ?? parsedId;
 
         return { documentId: newDocumentId, document: newDocument };
     }
 
     async dropCollection(databaseName: string, collectionName: string): Promise<boolean> {
-        const result = await this._mongoClient.db(databaseName).collection(collectionName).drop();
+        const result = await this.collectionHandle(databaseName, collectionName).drop();
         this._collectionsCache.delete(databaseName);
+        this.invalidateStatsCaches(databaseName, collectionName);
         return result;
     }
 
@@ -1050,6 +1116,7 @@ export class ClustersClient {
         const result = await this._mongoClient.db(databaseName).dropDatabase();
         this._databasesCache = null;
         this._collectionsCache.delete(databaseName);
+        this.invalidateStatsCaches(databaseName);
         return result;
     }
 
@@ -1077,7 +1144,7 @@ export class ClustersClient {
         if (documents.length === 0) {
             return { acknowledged: false, insertedIds: {}, insertedCount: 0 };
         }
-        const collection = this._mongoClient.db(databaseName).collection(collectionName);
+        const collection = this.collectionHandle(databaseName, collectionName);
 
         try {
             const insertManyResults = await collection.insertMany(documents, {
@@ -1087,8 +1154,12 @@ export class ClustersClient {
                 // More details: https://www.mongodb.com/docs/manual/reference/method/db.collection.insertMany/#syntax
                 ordered: ordered,
             });
+            this.invalidateStatsCaches(databaseName, collectionName);
             return insertManyResults;
         } catch (error) {
+            // A bulk write error can still have inserted part of the batch
+            this.invalidateStatsCaches(databaseName, collectionName);
+
             // Log error messages to the console
             if (error instanceof MongoBulkWriteError) {
                 throw error;
@@ -1114,7 +1185,17 @@ export class ClustersClient {
         if (!this._llmEnhancedFeatureApis) {
             throw new Error('LLM Enhanced Feature APIs not initialized. Ensure the client is connected.');
         }
-        return this._llmEnhancedFeatureApis.getIndexStats(databaseName, collectionName);
+
+        // Same reuse pattern as getCollectionStats: the index advisor asks for these on every run.
+        const cacheKey = `${databaseName}.${collectionName}`;
+        const cached = this._indexStatsCache.get(cacheKey);
+        if (cached && Date.now() - cached.timestamp < STATS_CACHE_TTL_MS) {
+            return cached.result;
+        }
+
+        const result = await this._llmEnhancedFeatureApis.getIndexStats(databaseName, collectionName);
+        this._indexStatsCache.set(cacheKey, { result, timestamp: Date.now() });
+        return result;
     }
 
     /**
@@ -1127,7 +1208,38 @@ export class ClustersClient {
         if (!this._llmEnhancedFeatureApis) {
             throw new Error('LLM Enhanced Feature APIs not initialized. Ensure the client is connected.');
         }
-        return this._llmEnhancedFeatureApis.getCollectionStats(databaseName, collectionName);
+
+        // Repeated index advisor runs on the same collection re-request the same
+        // stats within seconds; serve those from a short-lived cache.
+        const cacheKey = `${databaseName}.${collectionName}`;
+        const cached = this._collectionStatsCache.get(cacheKey);
+        if (cached && Date.now() - cached.timestamp < STATS_CACHE_TTL_MS) {
+            return cached.result;
+        }
+
+        const result = await this._llmEnhancedFeatureApis.getCollectionStats(databaseName, collectionName);
+        this._collectionStatsCache.set(cacheKey, { result, timestamp: Date.now() });
+        return result;
+    }
+
+    /**
+     * Drops cached collection and index stats for a single collection, or for every
+     * collection in the database when `collectionName` is omitted.
+     */
+    private invalidateStatsCaches(databaseName: string, collectionName?: string): void {
+        for (const cache of [this._collectionStatsCache, this._indexStatsCache]) {
+            if (collectionName !== undefined) {
+                cache.delete(`${databaseName}.${collectionName}`);
+                continue;
+            }
+
+            const prefix = `${databaseName}.`;
+            for (const key of cache.keys()) {
+                if (key.startsWith(prefix)) {
+                    cache.delete(key);
+                }
+            }
+        }
     }
 
     /**
@@ -1201,7 +1313,9 @@ export class ClustersClient {
         if (!this._llmEnhancedFeatureApis) {
             throw new Error('LLM Enhanced Feature APIs not initialized. Ensure the client is connected.');
         }
-        return this._llmEnhancedFeatureApis.createIndex(databaseName, collectionName, indexSpec);
+        const result = await this._llmEnhancedFeatureApis.createIndex(databaseName, collectionName, indexSpec);
+        this.invalidateStatsCaches(databaseName, collectionName);
+        return result;
     }
 
     /**
@@ -1215,7 +1329,9 @@ export class ClustersClient {
         if (!this._llmEnhancedFeatureApis) {
             throw new Error('LLM Enhanced Feature APIs not initialized. Ensure the client is connected.');
         }
-        return this._llmEnhancedFeatureApis.dropIndex(databaseName, collectionName, indexName);
+        const result = await this._llmEnhancedFeatureApis.dropIndex(databaseName, collectionName, indexName);
+        this.invalidateStatsCaches(databaseName, collectionName);
+        return result;
     }
 
     /**
@@ -1243,7 +1359,9 @@ export class ClustersClient {
         if (!this._llmEnhancedFeatureApis) {
             throw new Error('LLM Enhanced Feature APIs not initialized. Ensure the client is connected.');
         }
-        return this._llmEnhancedFeatureApis.hideIndex(databaseName, collectionName, indexName);
+        const result = await this._llmEnhancedFeatureApis.hideIndex(databaseName, collectionName, indexName);
+        this.invalidateStatsCaches(databaseName, collectionName);
+        return result;
     }
 
     /**
@@ -1257,6 +1375,8 @@ export class ClustersClient {
         if (!this._llmEnhancedFeatureApis) {
             throw new Error('LLM Enhanced Feature APIs not initialized. Ensure the client is connected.');
         }
-        return this._llmEnhancedFeatureApis.unhideIndex(databaseName, collectionName, indexName);
+        const result = await this._llmEnhancedFeatureApis.unhideIndex(databaseName, collectionName, indexName);
+        this.invalidateStatsCaches(databaseName, collectionName);
+        return result;
     }
 }
@@ -0,0 +1,117 @@
+/*---------------------------------------------------------------------------------------------
+ *  Copyright (c) Microsoft Corporation. All rights reserved.
+ *  Licensed under the MIT License. See License.txt in the project root for license information.
+ *--------------------------------------------------------------------------------------------*/
+
+import { MongoServerError, type Collection, type Document, type MongoClient } from 'mongodb';
+import { llmEnhancedFeatureApis } from './LlmEnhancedFeatureApis';
+
+describe('llmEnhancedFeatureApis.getCollectionStats', () => {
+    const commandStats = {
+        ns: 'db.coll',
+        count: 10,
+        size: 1000,
+        avgObjSize: 100,
+        storageSize: 4096,
+        nindexes: 2,
+        totalIndexSize: 8192,
+        indexSizes: { _id_: 4096, a_1: 4096 },
+    };
+
+    let aggregateMock: jest.Mock;
+    let commandMock: jest.Mock;
+    let apis: llmEnhancedFeatureApis;
+
+    beforeEach(() => {
+        aggregateMock = jest.fn();
+        commandMock = jest.fn().mockResolvedValue(commandStats);
+        const mongoClient = { db: jest.fn(() => ({ command: commandMock })) } as unknown as MongoClient;
+        const collection = { aggregate: aggregateMock } as unknown as Collection<Document>;
+        apis = new llmEnhancedFeatureApis(mongoClient, () => collection);
+    });
+
+    function aggregateResolves(results: Document[]): void {
+        aggregateMock.mockReturnValue({ toArray: jest.fn().mockResolvedValue(results) });
+    }
+
+    function aggregateRejects(error: Error): void {
+        aggregateMock.mockReturnValue({ toArray: jest.fn().mockRejectedValue(error) });
+    }
+
+    it('uses the $collStats result when it reports storage stats', async () => {
+        aggregateResolves([
+            {
+                ns: 'db.coll',
+                storageStats: {
+                    count: 5,
+                    size: 500,
+                    avgObjSize: 100,
+                    storageSize: 2048,
+                    nindexes: 1,
+                    totalIndexSize: 1024,
+                    indexSizes: { _id_: 1024 },
+                },
+            },
+        ]);
+
+        const stats = await apis.getCollectionStats('db', 'coll');
+
+        expect(stats).toEqual({
+            ns: 'db.coll',
+            count: 5,
+            size: 500,
+            avgObjSize: 100,
+            storageSize: 2048,
+            nindexes: 1,
+            totalIndexSize: 1024,
+            indexSizes: { _id_: 1024 },
+        });
+        expect(commandMock).not.toHaveBeenCalled();
+    });
+
+    it('falls back to the collStats command when $collStats omits storageStats', async () => {
+        aggregateResolves([{ ns: 'db.coll' }]);
+
+        const stats = await apis.getCollectionStats('db', 'coll');
+
+        expect(commandMock).toHaveBeenCalledWith({ collStats: 'coll' });
+        expect(stats).toEqual(commandStats);
+    });
+
+    it('falls back to the collStats command for sharded results', async () => {
+        aggregateResolves([
+            { ns: 'db.coll', storageStats: { count: 1 } },
+            { ns: 'db.coll', storageStats: { count: 2 } },
+        ]);
+
+        const stats = await apis.getCollectionStats('db', 'coll');
+
+        expect(commandMock).toHaveBeenCalledWith({ collStats: 'coll' });
+        expect(stats).toEqual(commandStats);
+    });
+
+    it.each([59, 115, 235, 40324])('falls back to the collStats command on unsupported error code %d', async (code) => {
+        aggregateRejects(new MongoServerError({ message: 'not supported', code }));
+
+        const stats = await apis.getCollectionStats('db', 'coll');
+
+        expect(commandMock).toHaveBeenCalledWith({ collStats: 'coll' });
+        expect(stats).toEqual(commandStats);
+    });
+
+    it('rethrows other server errors without trying the command', async () => {
+        const error = new MongoServerError({ message: 'not authorized', code: 13 });
+        aggregateRejects(error);
+
+        await expect(apis.getCollectionStats('db', 'coll')).rejects.toBe(error);
+        expect(commandMock).not.toHaveBeenCalled();
+    });
+
+    it('rethrows non-server errors without trying the command', async () => {
+        const error = new Error('connection reset');
+        aggregateRejects(error);
+
+        await expect(apis.getCollectionStats('db', 'coll')).rejects.toBe(error);
+        expect(commandMock).not.toHaveBeenCalled();
+    });
+});
@@ -8,10 +8,21 @@
  */
 
 import * as l10n from '@vscode/l10n';
-import { type Document, type Filter, type MongoClient, type Sort } from 'mongodb';
+import { MongoServerError, type Collection, type Document, type Filter, type MongoClient, type Sort } from 'mongodb';
 import { ext } from '../extensionVariables';
 import { type ExplainVerbosity } from './client/QueryInsightsApis';
 
+/**
+ * Server error codes meaning `$collStats` is not available, so getCollectionStats
+ * should fall back to the `collStats` command. Any other failure is rethrown.
+ */
+const COLL_STATS_UNSUPPORTED_CODES: ReadonlySet<number> = new Set([
+    59, // CommandNotFound
+    115, // CommandNotSupported
+    235, // InternalErrorNotSupported
+    40324, // Unrecognized pipeline stage name
+]);
+
 /**
  * Options for explain operations
  */
@@ -167,11 +178,24 @@ export interface ExplainResult {
     ok: number;
 }
 
+/**
+ * Resolves the collection handle for a namespace
+ */
+export type CollectionResolver = (databaseName: string, collectionName: string) => Collection<Document>;
+
 /**
  * LLM Enhanced Feature APIs
  */
 export class llmEnhancedFeatureApis {
-    constructor(private readonly mongoClient: MongoClient) {}
+    /**
+     * @param mongoClient - Connected client used for database-level commands
+     * @param getCollection - Resolves collection handles. ClustersClient passes its
+     *   handle cache so repeated calls on the same collection reuse one handle.
+     */
+    constructor(
+        private readonly mongoClient: MongoClient,
+        private readonly getCollection: CollectionResolver = (db, coll) => mongoClient.db(db).collection(coll),
+    ) {}
 
     /**
      * Get statistics for all indexes in a collection
@@ -180,7 +204,7 @@ export class llmEnhancedFeatureApis {
      * @returns Array of index statistics
      */
     async getIndexStats(databaseName: string, collectionName: string): Promise<IndexStats[]> {
-        const collection = this.mongoClient.db(databaseName).collection(collectionName);
+        const collection = this.getCollection(databaseName, collectionName);
 
         const indexStatsResult = await collection
             .aggregate([
@@ -212,15 +236,58 @@ export class llmEnhancedFeatureApis {
      * @returns Collection statistics
      */
     async getCollectionStats(databaseName: string, collectionName: string): Promise<CollectionStats> {
-        const db = this.mongoClient.db(databaseName);
+        const collection = this.getCollection(databaseName, collectionName);
+
+        // Prefer the $collStats aggregation stage over the collStats command, which
+        // is deprecated on newer servers. $collStats returns one document per shard,
+        // so sharded collections (and servers without the stage) use the command,
+        // which reports totals across shards. Note that sharded collections therefore
+        // always pay for two round-trips: the aggregate, then the command.
+        let stats: Document | undefined;
+        try {
+            const results = await collection
+                .aggregate([
+                    { $collStats: { storageStats: {} } },
+                    // storageStats also carries per-index and storage-engine details
+                    // (indexDetails, wiredTiger) that can be tens of KB per index;
+                    // keep only the fields mapped into CollectionStats.
+                    {
+                        $project: {
+                            _id: 0,
+                            ns: 1,
+                            'storageStats.count': 1,
+                            'storageStats.size': 1,
+                            'storageStats.avgObjSize': 1,
+                            'storageStats.storageSize': 1,
+                            'storageStats.nindexes': 1,
+                            'storageStats.totalIndexSize': 1,
+                            'storageStats.indexSizes': 1,
+                        },
+                    },
+                ])
+                .toArray();
+            // Only trust the stage when it actually reported storage stats; otherwise every
+            // field would default to 0, so let the collStats command answer instead.
+            const storageStats = results.length === 1 ? (results[0].storageStats as unknown) : undefined;
+            if (storageStats !== null && typeof storageStats === 'object') {
+                stats = { ns: results[0].ns as string, ...(storageStats as Document) };
+            }
+        } catch (error) {
+            // Only an unsupported stage falls through to the collStats command; auth,
+            // network or abort failures would fail the same way there, so surface them.
+            if (!(error instanceof MongoServerError && COLL_STATS_UNSUPPORTED_CODES.has(Number(error.code)))) {
+                throw error;
+            }
+        }
 
-        // Use the collStats command to get detailed collection statistics
-        const stats = await db.command({
-            collStats: collectionName,
-        });
+        if (!stats) {
+            stats = await this.mongoClient.db(databaseName).command({
+                collStats: collectionName,
+            });
+        }
 
         return {
-            ns: stats.ns as string,
+            ns: (stats.ns as string) ?? `${databaseName}.${collectionName}`,
             count: (stats.count as number) ?? 0,
             size: (stats.size as number) ?? 0,
             avgObjSize: (stats.avgObjSize as number) ?? 0,
@@ -256,30 +323,16 @@ export class llmEnhancedFeatureApis {
 
         const { filter = {}, sort, projection, skip, limit } = options;
 
-        const findCmd: Document = {
-            find: collectionName,
-            filter,
-        };
-
-        // Add optional fields if they are defined
-        if (sort !== undefined && Object.keys(sort).length > 0) {
-            findCmd.sort = sort;
-        }
-
-        if (projection !== undefined && Object.keys(projection).length > 0) {
-            findCmd.projection = projection;
-        }
-
-        if (skip !== undefined && skip >= 0) {
-            findCmd.skip = skip;
-        }
-
-        if (limit !== undefined && limit >= 0) {
-            findCmd.limit = limit;
-        }
-
+        // Optional fields are only included when they are defined
         const command: Document = {
-            explain: findCmd,
+            explain: {
+                find: collectionName,
+                filter,
+                ...(sort !== undefined && Object.keys(sort).length > 0 && { sort }),
+                ...(projection !== undefined && Object.keys(projection).length > 0 && { projection }),
+                ...(skip !== undefined && skip >= 0 && { skip }),
+                ...(limit !== undefined && limit >= 0 && { limit }),
+            },
             verbosity: verbosity,
         };
 
@@ -572,14 +625,19 @@ export class llmEnhancedFeatureApis {
      * @returns Array of sample documents
      */
     async getSampleDocuments(databaseName: string, collectionName: string, limit: number = 10): Promise<Document[]> {
-        const collection = this.mongoClient.db(databaseName).collection(collectionName);
+        const collection = this.getCollection(databaseName, collectionName);
 
+        // Request the whole sample in the first batch so samples larger than the
+        // server's default first batch (101 documents) don't need a getMore.
         const sampleDocuments = await collection
-            .aggregate([
-                {
-                    $sample: { size: limit },
-                },
-            ])
+            .aggregate(
+                [
+                    {
+                        $sample: { size: limit },
+                    },
+                ],
+                { batchSize: limit },
+            )
             .toArray();
 
         return sampleDocuments;
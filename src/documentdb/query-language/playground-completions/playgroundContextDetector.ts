@@ -58,6 +58,30 @@ const DATABASE_METHODS = new Set([
     'listCommands',
 ]);
 
+/** Cursor methods that can be chained without changing the cursor type */
+const CURSOR_CHAIN_METHODS = new Set([
+    'limit',
+    'skip',
+    'sort',
+    'toArray',
+    'forEach',
+    'map',
+    'count',
+    'explain',
+    'hasNext',
+    'next',
+    'batchSize',
+    'close',
+    'collation',
+    'hint',
+    'comment',
+    'maxTimeMS',
+    'readConcern',
+    'readPref',
+    'returnKey',
+    'showRecordId',
+]);
+
 /**
  * Detects the JS-level context of the cursor in a query playground file.
  *
@@ -473,29 +497,7 @@ function maskNonCodeRegions(text: string): string {
 }
 
 function isCursorMethod(name: string): boolean {
-    const cursorMethods = new Set([
-        'limit',
-        'skip',
-        'sort',
-        'toArray',
-        'forEach',
-        'map',
-        'count',
-        'explain',
-        'hasNext',
-        'next',
-        'batchSize',
-        'close',
-        'collation',
-        'hint',
-        'comment',
-        'maxTimeMS',
-        'readConcern',
-        'readPref',
-        'returnKey',
-        'showRecordId',
-    ]);
-    return cursorMethods.has(name);
+    return CURSOR_CHAIN_METHODS.has(name);
 }
 
 /**
@@ -288,6 +288,37 @@ describe('ExplainPlanAnalyzer.addIndexStrategyAdvisories', () => {
         });
     });
 
+    describe('IXSCAN stage lookup', () => {
+        afterEach(() => {
+            jest.restoreAllMocks();
+        });
+
+        it('does not walk the plan trees for collection scans', () => {
+            const findStageSpy = jest.spyOn(ExplainPlanAnalyzer, 'findStageInPlan');
+            const analysis = makeAnalysis({ isIndexScan: false, isCollectionScan: true, efficiencyRatio: 0.1 });
+
+            ExplainPlanAnalyzer.addIndexStrategyAdvisories(analysis, 1000, makeExplainResult({ isBitmap: true }));
+
+            expect(findStageSpy).not.toHaveBeenCalled();
+        });
+
+        it('walks each plan tree once when both bitmap and cardinality advisories run', () => {
+            const findStageSpy = jest.spyOn(ExplainPlanAnalyzer, 'findStageInPlan');
+            const analysis = makeAnalysis({ efficiencyRatio: 0.5 });
+            const explainResult = makeExplainResult({ isBitmap: true });
+            const winningPlan = (explainResult.queryPlanner as Document).winningPlan as Document;
+            const executionStages = (explainResult.executionStats as Document).executionStages as Document;
+
+            ExplainPlanAnalyzer.addIndexStrategyAdvisories(analysis, 1000, explainResult);
+
+            const rootCalls = (root: Document): number =>
+                findStageSpy.mock.calls.filter(([plan]) => plan === root).length;
+            expect(rootCalls(winningPlan)).toBe(1);
+            expect(rootCalls(executionStages)).toBe(1);
+            expect(getDiagnosticIds(analysis.performanceRating.diagnostics)).toContain('low_cardinality_index');
+        });
+    });
+
     describe('cumulative advisory demotions', () => {
         it('demotes score twice when both bitmap and severe multikey thresholds are met', () => {
             // Single-field bitmap with 50% coverage + 25× multikey expansion
@@ -496,41 +496,31 @@ export class ExplainPlanAnalyzer {
             return false;
         }
 
-        // Recursively check for SORT stages
-        const checkStageForSort = (stage: Document): boolean => {
+        // Walk the stage tree depth-first with an explicit stack, stopping at the first SORT stage
+        const stack: Document[] = [executionStages];
+        while (stack.length > 0) {
+            const stage = stack.pop()!;
             const stageName = stage.stage as string | undefined;
 
             if (stageName === 'SORT' || stageName === 'SORT_KEY_GENERATOR') {
                 return true;
             }
 
-            // Check child stages
+            // Queue child stages
             if (stage.inputStage) {
-                if (checkStageForSort(stage.inputStage as Document)) {
-                    return true;
-                }
+                stack.push(stage.inputStage as Document);
             }
 
             if (stage.inputStages && Array.isArray(stage.inputStages)) {
-                for (const childStage of stage.inputStages) {
-                    if (checkStageForSort(childStage as Document)) {
-                        return true;
-                    }
-                }
+                stack.push(...(stage.inputStages as Document[]));
             }
 
             if (stage.shards && Array.isArray(stage.shards)) {
-                for (const shard of stage.shards) {
-                    if (checkStageForSort(shard as Document)) {
-                        return true;
-                    }
-                }
+                stack.push(...(stage.shards as Document[]));
             }
+        }
 
-            return false;
-        };
-
-        return checkStageForSort(executionStages);
+        return false;
     }
 
     /**
@@ -773,6 +763,22 @@ export class ExplainPlanAnalyzer {
         return undefined;
     }
 
+    /**
+     * Looks up the first IXSCAN stage in both plan trees of an explain result:
+     * `planner` from `queryPlanner.winningPlan`, `exec` from `executionStats.executionStages`.
+     */
+    private static findIxscanStages(explainResult: Document): IxscanStages {
+        const winningPlan = (explainResult.queryPlanner as Document | undefined)?.winningPlan as Document | undefined;
+        const executionStages = (explainResult.executionStats as Document | undefined)?.executionStages as
+            | Document
+            | undefined;
+
+        return {
+            planner: this.findStageInPlan(winningPlan, 'IXSCAN'),
+            exec: this.findStageInPlan(executionStages, 'IXSCAN'),
+        };
+    }
+
     /**
      * Returns true if any boolean primitive appears anywhere in the filter tree.
      * Recurses into operator objects (`$eq`, `$ne`, `$in` arrays), logical
@@ -812,13 +818,26 @@ export class ExplainPlanAnalyzer {
         explainResult: Document,
         totalCollectionDocs: number | undefined,
         queryFilter?: Document,
+    ): { isLowCardinality: boolean; reasons: string[] } {
+        return this.detectLowCardinalityFromStages(
+            this.findIxscanStages(explainResult),
+            totalCollectionDocs,
+            queryFilter,
+        );
+    }
+
+    /**
+     * {@link detectLowCardinalityIndex} on IXSCAN stages the caller has already resolved.
+     */
+    private static detectLowCardinalityFromStages(
+        ixscanStages: IxscanStages,
+        totalCollectionDocs: number | undefined,
+        queryFilter?: Document,
     ): { isLowCardinality: boolean; reasons: string[] } {
         const reasons: string[] = [];
 
         // Signal 1: isBitmap flag on the IXSCAN stage (from queryPlanner.winningPlan)
-        const winningPlan = (explainResult.queryPlanner as Document | undefined)?.winningPlan as Document | undefined;
-        const ixscanStage = this.findStageInPlan(winningPlan, 'IXSCAN');
-        if (ixscanStage?.isBitmap === true) {
+        if (ixscanStages.planner?.isBitmap === true) {
             reasons.push(l10n.t('Bitmap index detected: typically used for low-cardinality fields'));
         }
 
@@ -834,11 +853,7 @@ export class ExplainPlanAnalyzer {
         // individual key cardinality is not meaningful — the key combination handles
         // selectivity (e.g., boolean prefix + selective range is a valid pattern).
         if (totalCollectionDocs && totalCollectionDocs > 0) {
-            const executionStages = (explainResult.executionStats as Document | undefined)?.executionStages as
-                | Document
-                | undefined;
-            const ixscanExec = this.findStageInPlan(executionStages, 'IXSCAN');
-            const indexUsage = ixscanExec?.indexUsage as Array<{ scanKeys?: string[] }> | undefined;
+            const indexUsage = ixscanStages.exec?.indexUsage as Array<{ scanKeys?: string[] }> | undefined;
 
             if (indexUsage) {
                 for (const usage of indexUsage) {
@@ -893,6 +908,11 @@ export class ExplainPlanAnalyzer {
     ): void {
         const diagnostics = analysis.performanceRating.diagnostics;
 
+        // Both the bitmap and the low-cardinality advisories inspect the IXSCAN stages. Resolve them
+        // lazily and at most once: both are gated on isIndexScan, so COLLSCAN plans never walk the trees.
+        let ixscanStages: IxscanStages | undefined;
+        const getIxscanStages = (): IxscanStages => (ixscanStages ??= this.findIxscanStages(explainResult));
+
         // --- Coverage badges (gated on index scan) ---
         if (analysis.isIndexScan && totalCollectionDocs && totalCollectionDocs > 0) {
             const coverage = Math.min(analysis.nReturned / totalCollectionDocs, 1);
@@ -928,19 +948,13 @@ export class ExplainPlanAnalyzer {
         // Compound indexes are excluded — a bitmap prefix with a selective second key
         // is a valid pattern (see Design Decision 3).
         if (analysis.isIndexScan) {
-            const winningPlan = (explainResult.queryPlanner as Document | undefined)?.winningPlan as
-                | Document
-                | undefined;
-            const ixscanStage = this.findStageInPlan(winningPlan, 'IXSCAN');
+            const ixscanStage = getIxscanStages().planner;
             if (ixscanStage?.isBitmap === true) {
                 // Detect single-field: check scanKeys in execution stats IXSCAN.
                 // Correlate by indexName so that on plans with multiple IXSCAN stages
                 // (e.g., OR, index intersection) we inspect the correct one.
                 const bitmapIndexName = ixscanStage.indexName as string | undefined;
-                const executionStages = (explainResult.executionStats as Document | undefined)?.executionStages as
-                    | Document
-                    | undefined;
-                const ixscanExec = this.findStageInPlan(executionStages, 'IXSCAN');
+                const ixscanExec = getIxscanStages().exec;
                 // Only use the exec IXSCAN if it matches the planner IXSCAN by name
                 const correlatedExec =
                     ixscanExec && bitmapIndexName && (ixscanExec.indexName as string) === bitmapIndexName
@@ -991,7 +1005,11 @@ export class ExplainPlanAnalyzer {
         if (analysis.isIndexScan && analysis.efficiencyRatio < 0.9) {
             const filter =
                 queryFilter ?? ((explainResult.command as Document | undefined)?.filter as Document | undefined);
-            const cardinalityResult = this.detectLowCardinalityIndex(explainResult, totalCollectionDocs, filter);
+            const cardinalityResult = this.detectLowCardinalityFromStages(
+                getIxscanStages(),
+                totalCollectionDocs,
+                filter,
+            );
 
             if (cardinalityResult.isLowCardinality) {
                 const reasonsList = cardinalityResult.reasons.map((r) => `• ${r}`).join('\n');
@@ -1050,6 +1068,14 @@ export class ExplainPlanAnalyzer {
     }
 }
 
+/**
+ * First IXSCAN stage found in each plan tree of an explain result
+ */
+interface IxscanStages {
+    planner: Document | undefined;
+    exec: Document | undefined;
+}
+
 /**
  * Result from analyzing queryPlanner output
  */
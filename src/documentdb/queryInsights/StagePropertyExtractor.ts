@@ -36,8 +36,8 @@ export class StagePropertyExtractor {
      * @param winningPlan   - The queryPlanner.winningPlan document
      */
     public static enrichWithQueryPlannerInfo(stageInfoList: ExtendedStageInfo[], winningPlan: Document): void {
-        const plannerStages: Document[] = [];
-        this.collectPlannerStages(winningPlan, plannerStages);
+        const plannerStagesByName = new Map<string, Document[]>();
+        this.collectPlannerStages(winningPlan, plannerStagesByName);
 
         for (const info of stageInfoList) {
             if (info.stageName !== 'IXSCAN' && info.stageName !== 'EXPRESS_IXSCAN') {
@@ -46,9 +46,9 @@ export class StagePropertyExtractor {
 
             // Find matching planner stage by stage name + index name
             const indexName = info.properties['Index Name'] as string | undefined;
-            const match = plannerStages.find(
-                (ps) => ps.stage === info.stageName && (!indexName || ps.indexName === indexName),
-            );
+            const match = plannerStagesByName
+                .get(info.stageName)
+                ?.find((ps) => !indexName || ps.indexName === indexName);
 
             if (match?.isBitmap === true) {
                 info.properties['Bitmap'] = 'Yes';
@@ -57,14 +57,21 @@ export class StagePropertyExtractor {
     }
 
     /**
-     * Collects all stages from the queryPlanner winning plan tree into a flat array.
+     * Collects all stages from the queryPlanner winning plan tree, grouped by stage name.
+     * Each group keeps the stages in tree traversal order.
      */
-    private static collectPlannerStages(stage: Document, accumulator: Document[]): void {
+    private static collectPlannerStages(stage: Document, accumulator: Map<string, Document[]>): void {
         if (!stage || !stage.stage) {
             return;
         }
 
-        accumulator.push(stage);
+        const stageName = stage.stage as string;
+        const group = accumulator.get(stageName);
+        if (group) {
+            group.push(stage);
+        } else {
+            accumulator.set(stageName, [stage]);
+        }
 
         if (stage.inputStage) {
             this.collectPlannerStages(stage.inputStage as Document, accumulator);
@@ -179,10 +179,7 @@ export function transformStage2Response(
             hasInMemorySort: analyzed.hasInMemorySort,
             performanceRating: analyzed.performanceRating,
         },
-        stages: stages.map((stage) => ({
-            ...stage,
-            // Stage 2 has access to execution metrics
-        })),
+        stages,
         rawExecutionStats: analyzed.rawStats,
         extendedStageInfo: analyzed.extendedStageInfo, // Pass through extended stage properties for UI
     };
@@ -255,19 +252,7 @@ export function extractStagesFromDocument(explainResult: Document): StageInfo[]
 
     // Recursively traverse stages
     function traverseStage(stage: Document): void {
-        const stageName: string = (stage.stage as string | undefined) || 'UNKNOWN';
-
-        stages.push({
-            stage: stageName,
-            name: (stage.name as string | undefined) || stageName,
-            nReturned: (stage.nReturned as number | undefined) ?? 0,
-            executionTimeMs:
-                (stage.executionTimeMillis as number | undefined) ??
-                (stage.executionTimeMillisEstimate as number | undefined),
-            indexName: stage.indexName as string | undefined,
-            keysExamined: stage.keysExamined as number | undefined,
-            docsExamined: stage.docsExamined as number | undefined,
-        });
+        stages.push(toStageInfo(stage));
 
         // Traverse child stages
         if (stage.inputStage) {
@@ -311,18 +296,27 @@ function extractShardedInfoFromDocument(
         return { isSharded: false };
     }
 
+    // Index the executionStats shards by name once instead of searching them for every shard
+    const execStatsShards = (executionStats?.executionStages as Document | undefined)?.shards as Document[] | undefined;
+    const execStatsByShard = new Map<string, Document>();
+    for (const shardStats of execStatsShards ?? []) {
+        const name = shardStats.shardName as string;
+        if (!execStatsByShard.has(name)) {
+            execStatsByShard.set(name, shardStats);
+        }
+    }
+
     // Extract per-shard information
     const shards = shardsArray.map((shardDoc) => {
         const shardName = (shardDoc.shardName as string) || 'unknown';
 
+        // Per-shard execution stats, looked up once and shared by the stage and metric extraction below
+        const shardExecStats = hasExecutionStats ? execStatsByShard.get(shardName) : undefined;
+
         // Extract stages from this shard's plan
         let shardStages: StageInfo[] = [];
         if (hasExecutionStats) {
             // Get from executionStats
-            const execStatsShards = (executionStats?.executionStages as Document | undefined)?.shards as
-                | Document[]
-                | undefined;
-            const shardExecStats = execStatsShards?.find((s) => (s.shardName as string) === shardName);
             if (shardExecStats) {
                 shardStages = extractStagesFromShard(shardExecStats.executionStages as Document);
             }
@@ -343,10 +337,6 @@ function extractShardedInfoFromDocument(
         let hasBlockedSort = false;
 
         if (hasExecutionStats) {
-            const execStatsShards = (executionStats?.executionStages as Document | undefined)?.shards as
-                | Document[]
-                | undefined;
-            const shardExecStats = execStatsShards?.find((s) => (s.shardName as string) === shardName);
             if (shardExecStats) {
                 nReturned = shardExecStats.nReturned as number | undefined;
                 keysExamined = shardExecStats.totalKeysExamined as number | undefined;
@@ -354,40 +344,16 @@ function extractShardedInfoFromDocument(
                 executionTimeMs = shardExecStats.executionTimeMillis as number | undefined;
 
                 // Check for COLLSCAN and SORT in this shard's stages
-                const checkStages = (stage: Document): void => {
-                    const stageName = stage.stage as string | undefined;
-                    if (stageName === 'COLLSCAN') {
-                        hasCollscan = true;
-                    }
-                    if (stageName === 'SORT') {
-                        hasBlockedSort = true;
-                    }
-                    if (stage.inputStage) {
-                        checkStages(stage.inputStage as Document);
-                    }
-                };
                 const shardExecStagesDoc = shardExecStats.executionStages as Document | undefined;
                 if (shardExecStagesDoc) {
-                    checkStages(shardExecStagesDoc);
+                    ({ hasCollscan, hasBlockedSort } = detectShardStageConcerns(shardExecStagesDoc));
                 }
             }
         } else {
             // For queryPlanner, check for COLLSCAN and SORT in plan
-            const checkPlanStages = (stage: Document): void => {
-                const stageName = stage.stage as string | undefined;
-                if (stageName === 'COLLSCAN') {
-                    hasCollscan = true;
-                }
-                if (stageName === 'SORT') {
-                    hasBlockedSort = true;
-                }
-                if (stage.inputStage) {
-                    checkPlanStages(stage.inputStage as Document);
-                }
-            };
             const shardPlan = shardDoc.winningPlan as Document | undefined;
             if (shardPlan) {
-                checkPlanStages(shardPlan);
+                ({ hasCollscan, hasBlockedSort } = detectShardStageConcerns(shardPlan));
             }
         }
 
@@ -414,19 +380,7 @@ function extractStagesFromShard(shardPlan: Document): StageInfo[] {
     const stages: StageInfo[] = [];
 
     function traverseStage(stage: Document): void {
-        const stageName: string = (stage.stage as string | undefined) || 'UNKNOWN';
-
-        stages.push({
-            stage: stageName,
-            name: (stage.name as string | undefined) || stageName,
-            nReturned: (stage.nReturned as number | undefined) ?? 0,
-            executionTimeMs:
-                (stage.executionTimeMillis as number | undefined) ??
-                (stage.executionTimeMillisEstimate as number | undefined),
-            indexName: stage.indexName as string | undefined,
-            keysExamined: stage.keysExamined as number | undefined,
-            docsExamined: stage.docsExamined as number | undefined,
-        });
+        stages.push(toStageInfo(stage));
 
         // Traverse child stages
         if (stage.inputStage) {
@@ -442,6 +396,45 @@ function extractStagesFromShard(shardPlan: Document): StageInfo[] {
     return stages;
 }
 
+/**
+ * Builds the UI stage entry for a single explain stage
+ */
+function toStageInfo(stage: Document): StageInfo {
+    const stageName: string = (stage.stage as string | undefined) || 'UNKNOWN';
+
+    return {
+        stage: stageName,
+        name: (stage.name as string | undefined) || stageName,
+        nReturned: (stage.nReturned as number | undefined) ?? 0,
+        executionTimeMs:
+            (stage.executionTimeMillis as number | undefined) ??
+            (stage.executionTimeMillisEstimate as number | undefined),
+        indexName: stage.indexName as string | undefined,
+        keysExamined: stage.keysExamined as number | undefined,
+        docsExamined: stage.docsExamined as number | undefined,
+    };
+}
+
+/**
+ * Walks a shard's inputStage chain and reports whether it contains a COLLSCAN or a SORT stage
+ */
+function detectShardStageConcerns(rootStage: Document): { hasCollscan: boolean; hasBlockedSort: boolean } {
+    let hasCollscan = false;
+    let hasBlockedSort = false;
+
+    for (let stage: Document | undefined = rootStage; stage; stage = stage.inputStage as Document | undefined) {
+        const stageName = stage.stage as string | undefined;
+        if (stageName === 'COLLSCAN') {
+            hasCollscan = true;
+        }
+        if (stageName === 'SORT') {
+            hasBlockedSort = true;
+        }
+    }
+
+    return { hasCollscan, hasBlockedSort };
+}
+
 /**
  * Builds concerns array for sharded query
  */
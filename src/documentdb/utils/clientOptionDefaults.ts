@@ -0,0 +1,57 @@
+/*---------------------------------------------------------------------------------------------
+ *  Copyright (c) Microsoft Corporation. All rights reserved.
+ *  Licensed under the MIT License. See License.txt in the project root for license information.
+ *--------------------------------------------------------------------------------------------*/
+
+import { type MongoClientOptions } from 'mongodb';
+import { DocumentDBConnectionString } from './DocumentDBConnectionString';
+
+/**
+ * Driver options the extension applies to every cluster connection unless the
+ * user set them explicitly.
+ *
+ * - `maxIdleTimeMS`: the extension keeps one MongoClient per cluster for the
+ *   whole VS Code session. Bursts such as the tree's per-collection document
+ *   count fan-out grow the pool, and without an idle limit those sockets stay
+ *   open until the window closes. Five minutes keeps the pool warm across normal
+ *   interactive pauses while letting burst sockets go.
+ * - `compressors`: explain plans, collection stats and sampled documents are
+ *   verbose and repeat field names heavily, so wire compression pays off.
+ *   Only `zlib` is offered: it ships with Node, while the `snappy` and
+ *   `@mongodb-js/zstd` native modules are not bundled with the extension.
+ *   Servers that do not support compression negotiate it away per connection.
+ */
+export const DEFAULT_CLIENT_OPTIONS: Readonly<Pick<MongoClientOptions, 'maxIdleTimeMS' | 'compressors'>> = {
+    maxIdleTimeMS: 5 * 60 * 1000,
+    compressors: ['zlib'],
+};
+
+/**
+ * Fills in {@link DEFAULT_CLIENT_OPTIONS} on `options`.
+ *
+ * Options passed to the MongoClient constructor take precedence over the
+ * connection string, so a default is only applied when the user has not set
+ * the same option in the connection string (matched case-insensitively, as the
+ * driver does) and the auth handler has not set it either.
+ *
+ * @returns The same `options` object, for chaining.
+ */
+export function applyClientOptionDefaults(connectionString: string, options: MongoClientOptions): MongoClientOptions {
+    let uriOptionNames: Set<string>;
+    try {
+        const parsed = new DocumentDBConnectionString(connectionString);
+        uriOptionNames = new Set([...parsed.searchParams.keys()].map((key) => key.toLowerCase()));
+    } catch {
+        // Leave an unparseable connection string to the driver to report.
+        return options;
+    }
+
+    for (const [name, value] of Object.entries(DEFAULT_CLIENT_OPTIONS)) {
+        const key = name as keyof MongoClientOptions;
+        if (options[key] === undefined && !uriOptionNames.has(name.toLowerCase())) {
+            (options as Record<string, unknown>)[key] = value;
+        }
+    }
+
+    return options;
+}
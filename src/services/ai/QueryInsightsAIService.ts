@@ -860,7 +860,9 @@ export class QueryInsightsAIService {
      */
     private handleLearnMore(payload: unknown): { success: boolean; message?: string } {
         // TODO: Open documentation link in browser
-        console.log('Opening documentation for:', payload);
+        ext.outputChannel.trace(
+            l10n.t('[Query Insights Action] Learn more requested: {payload}', { payload: JSON.stringify(payload) }),
+        );
 
         return {
             success: true,
@@ -89,11 +89,11 @@ export class PromptTemplateService {
                         error: error instanceof Error ? error.message : String(error),
                     }),
                 );
-                template = this.getBuiltInIndexAdvisorTemplate(commandType);
+                template = await this.getBuiltInIndexAdvisorTemplate(commandType);
             }
         } else {
             // Use built-in template
-            template = this.getBuiltInIndexAdvisorTemplate(commandType);
+            template = await this.getBuiltInIndexAdvisorTemplate(commandType);
         }
 
         // Cache the template and its source (if caching is enabled)
@@ -202,7 +202,7 @@ export class PromptTemplateService {
      * @param commandType The command type
      * @returns The built-in template
      */
-    private static getBuiltInIndexAdvisorTemplate(commandType: CommandType): string {
+    private static getBuiltInIndexAdvisorTemplate(commandType: CommandType): Promise<string> {
         // Configuration for building prompts from resource files
         const promptConfigs: Record<string, { role: string; messages: string[]; task: string; fallback: string }> = {
             [CommandType.Find]: {
@@ -168,8 +168,7 @@ export class DocumentDbStreamingWriter extends StreamingDocumentWriter<string> {
      * Ensures the target collection exists, creating it if necessary.
      */
     public override async ensureTargetExists(): Promise<EnsureTargetExistsResult> {
-        const collections = await this.client.listCollections(this.databaseName);
-        const collectionExists = collections.some((col) => col.name === this.collectionName);
+        const collectionExists = await this.client.collectionExists(this.databaseName, this.collectionName);
 
         if (!collectionExists) {
             await this.client.createCollection(this.databaseName, this.collectionName);
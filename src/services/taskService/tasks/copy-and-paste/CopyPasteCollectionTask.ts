@@ -152,8 +152,10 @@ export class CopyPasteCollectionTask extends Task implements ResourceTrackingTas
         this.updateStatus(this.getStatus().state, vscode.l10n.t('Validating source collection...'));
         try {
             const sourceClient = await ClustersClient.getClient(this.config.source.clusterId);
-            const collections = await sourceClient.listCollections(this.config.source.databaseName);
-            const collectionExists = collections.some((c) => c.name === this.config.source.collectionName);
+            const collectionExists = await sourceClient.collectionExists(
+                this.config.source.databaseName,
+                this.config.source.collectionName,
+            );
 
             if (!collectionExists) {
                 // Clear the stale clipboard reference
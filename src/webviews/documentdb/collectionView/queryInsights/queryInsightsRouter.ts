@@ -24,7 +24,7 @@
  * updated.
  */
 
-import * as fs from 'fs';
+import * as fs from 'fs/promises';
 import { type Document } from 'mongodb';
 import * as path from 'path';
 import { z } from 'zod';
@@ -53,19 +53,26 @@ import { queryInsightsEventsRouter } from './queryInsightsEventsRouter';
  * Looks for files in resources/debug/ directory
  * Returns the raw MongoDB explain response if file exists and is valid, otherwise null
  *
+ * Uses async fs APIs: this runs on every Stage 1/2 request, so it must not
+ * block the extension host while the file system is probed.
+ *
  * To activate: set `"_debug_active": true` in the JSON file. The override is
  * ignored unless `_debug_active` is truthy (a missing or falsy flag disables it).
  */
-function readQueryInsightsDebugFile(filename: string): Document | null {
+async function readQueryInsightsDebugFile(filename: string): Promise<Document | null> {
     try {
         const debugFilePath = path.join(ext.context.extensionPath, 'resources', 'debug', filename);
 
-        if (!fs.existsSync(debugFilePath)) {
-            return null;
+        let content: string;
+        try {
+            content = (await fs.readFile(debugFilePath, 'utf8')).trim();
+        } catch (readError) {
+            if ((readError as NodeJS.ErrnoException).code === 'ENOENT') {
+                return null;
+            }
+            throw readError;
         }
 
-        const content = fs.readFileSync(debugFilePath, 'utf8').trim();
-
         if (!content) {
             return null;
         }
@@ -153,7 +160,7 @@ export const queryInsightsQueriesRouter = router({
         }
 
         // Check for debug override file first
-        const debugData = readQueryInsightsDebugFile('query-insights-stage1.json');
+        const debugData = await readQueryInsightsDebugFile('query-insights-stage1.json');
         if (debugData) {
             ext.outputChannel.trace(l10n.t('[Query Insights Stage 1] Using debug data file'));
             // Use debug data - analyze it the same way as real data
@@ -233,7 +240,7 @@ export const queryInsightsQueriesRouter = router({
         let totalCollectionDocs: number | undefined;
 
         // Check for debug override file first
-        const debugData = readQueryInsightsDebugFile('query-insights-stage2.json');
+        const debugData = await readQueryInsightsDebugFile('query-insights-stage2.json');
         let queryFilter: Document | undefined;
         if (debugData) {
             ext.outputChannel.trace(l10n.t('[Query Insights Stage 2] Using debug data file'));
@@ -251,6 +258,14 @@ export const queryInsightsQueriesRouter = router({
             // Get query parameters from session with parsed BSON objects
             const queryParams = session.getCurrentFindQueryParamsWithObjects();
 
+            // Fetch total collection docs for index-strategy advisories and selectivity cell.
+            // It does not depend on the explain result, so start it now and let its
+            // round-trip overlap the executionStats explain.
+            // Non-critical — on failure advisories and selectivity will simply not fire/display
+            const totalCollectionDocsPromise = session
+                .getEstimatedDocumentCount(databaseName, collectionName)
+                .catch(() => undefined);
+
             // Get execution stats (cached or fetch) without skip/limit for full query insights
             const executionStatsStart = Date.now();
             const executionStatsResult = await session.getExecutionStats(
@@ -275,13 +290,7 @@ export const queryInsightsQueriesRouter = router({
             explainResult = executionStatsResult;
             queryFilter = queryParams.filterObj as Document | undefined;
 
-            // Fetch total collection docs for index-strategy advisories and selectivity cell
-            try {
-                totalCollectionDocs = await session.getClient().estimateDocumentCount(databaseName, collectionName);
-            } catch {
-                // Non-critical — advisories and selectivity will simply not fire/display
-                totalCollectionDocs = undefined;
-            }
+            totalCollectionDocs = await totalCollectionDocsPromise;
         }
 
         // Extract extended stage info (as per design document)
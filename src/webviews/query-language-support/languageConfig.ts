@@ -29,6 +29,12 @@ export enum EditorType {
     Aggregation = 'aggregation',
 }
 
+/** Matches `documentdb://<editorType>/<sessionId>`; built once since parsing runs on every completion and hover. */
+const EDITOR_URI_PATTERN = new RegExp(`^${URI_SCHEME}://([^/]+)/(.+)$`);
+
+/** Set of the {@link EditorType} values, for constant-time validation of parsed URIs. */
+const KNOWN_EDITOR_TYPES: ReadonlySet<string> = new Set(Object.values(EditorType));
+
 /**
  * Builds a Monaco model URI for a given editor type and session.
  *
@@ -50,7 +56,7 @@ export function parseEditorUri(uri: string): { editorType: EditorType; sessionId
     // Handle both URI objects and strings
     const uriString = typeof uri === 'string' ? uri : String(uri);
 
-    const match = uriString.match(new RegExp(`^${URI_SCHEME}://([^/]+)/(.+)$`));
+    const match = EDITOR_URI_PATTERN.exec(uriString);
     if (!match) {
         return undefined;
     }
@@ -59,7 +65,7 @@ export function parseEditorUri(uri: string): { editorType: EditorType; sessionId
     const sessionId = match[2];
 
     // Validate that it's a known editor type
-    if (!Object.values(EditorType).includes(editorType)) {
+    if (!KNOWN_EDITOR_TYPES.has(editorType)) {
         return undefined;
     }
 